@@ -122,16 +122,9 @@ def draw_alert_entity_graph(
         Position scale (the default is 1)
 
     """
-    alert_node = [
-        n
-        for (n, node_type) in nx.get_node_attributes(nx_graph, "node_type").items()
-        if node_type == "alert"
-    ]
-    entity_nodes = [
-        n
-        for (n, node_type) in nx.get_node_attributes(nx_graph, "node_type").items()
-        if node_type == "entity"
-    ]
+    node_types = nx_graph.nodes(data="node_type")
+    alert_node = [n for (n, node_type) in node_types if node_type == "alert"]
+    entity_nodes = [n for (n, node_type) in node_types if node_type == "entity"]
 
     # now draw them in subsets  using the `nodelist` arg
     plt.rcParams["figure.figsize"] = (width, height)
@@ -183,6 +176,7 @@ _WINDOWS_SID = {
 _ADMINISTRATOR_SID = "500"
 _GUEST_SID = "501"
 _DOM_OR_MACHINE_SID = "S-1-5-21"
+_SYSTEM_LOGON_SESSIONS = {"0x3e7", "-1"}
 
 
 @export
@@ -207,55 +201,51 @@ def display_logon_data(
     if not os_family:
         os_family = alert.os_family if alert else "Windows"
 
-    for _, logon_row in logon_event.iterrows():
+    for logon_row in logon_event.itertuples(index=False):
         print("### Account Logon")
-        print("Account: ", logon_row["TargetUserName"])
-        print("Account Domain: ", logon_row["TargetDomainName"])
-        print("Logon Time: ", logon_row["TimeGenerated"])
+        print("Account: ", logon_row.TargetUserName)
+        print("Account Domain: ", logon_row.TargetDomainName)
+        print("Logon Time: ", logon_row.TimeGenerated)
 
         if os_family == "Windows":
-            logon_type = logon_row["LogonType"]
-            logon_desc_idx = logon_type
-            if logon_type not in _WIN_LOGON_TYPE_MAP:
-                logon_desc_idx = 0
-            print(
-                f"Logon type: {logon_type} ", f"({_WIN_LOGON_TYPE_MAP[logon_desc_idx]})"
-            )
+            logon_type = logon_row.LogonType
+            logon_desc = _WIN_LOGON_TYPE_MAP.get(logon_type, _WIN_LOGON_TYPE_MAP[0])
+            print(f"Logon type: {logon_type} ", f"({logon_desc})")
 
         account_id = logon_row.TargetUserSid
         print("User Id/SID: ", account_id)
         if os_family == "Windows":
             _print_sid_info(account_id)
         else:
-            print("Audit user: ", logon_row["audit_user"])
+            print("Audit user: ", getattr(logon_row, "audit_user", None))
 
-        session_id = logon_row["TargetLogonId"]
+        session_id = logon_row.TargetLogonId
         print(f"Session id '{session_id}'", end="  ")
-        if session_id in ["0x3e7", "-1"]:
+        if session_id in _SYSTEM_LOGON_SESSIONS:
             print("System logon session")
 
         print()
-        domain = logon_row["SubjectDomainName"]
+        domain = logon_row.SubjectDomainName
         if not domain:
             subj_account = logon_row.SubjectUserName
         else:
             subj_account = f"{domain}/{logon_row.SubjectUserName}"
         print("Subject (source) account: ", subj_account)
 
-        print("Logon process: ", logon_row["LogonProcessName"])
-        print("Authentication: ", logon_row["AuthenticationPackageName"])
-        print("Source IpAddress: ", logon_row["IpAddress"])
-        print("Source Host: ", logon_row["WorkstationName"])
-        print("Logon status: ", logon_row["Status"])
+        print("Logon process: ", logon_row.LogonProcessName)
+        print("Authentication: ", logon_row.AuthenticationPackageName)
+        print("Source IpAddress: ", logon_row.IpAddress)
+        print("Source Host: ", logon_row.WorkstationName)
+        print("Logon status: ", logon_row.Status)
         print()
 
 
 def _print_sid_info(sid):
     if sid in _WINDOWS_SID:
-        print("    SID {} is {}".format(sid, _WINDOWS_SID[sid]))
+        print(f"    SID {sid} is {_WINDOWS_SID[sid]}")
     elif sid.endswith(_ADMINISTRATOR_SID):
-        print("    SID {} is administrator".format(sid))
+        print(f"    SID {sid} is administrator")
     elif sid.endswith(_GUEST_SID):
-        print("    SID {} is guest".format(sid))
+        print(f"    SID {sid} is guest")
     if sid.startswith(_DOM_OR_MACHINE_SID):
-        print("    SID {} is local machine or domain account".format(sid))
+        print(f"    SID {sid} is local machine or domain account")
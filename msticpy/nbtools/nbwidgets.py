@@ -825,7 +825,7 @@ class SelectString:
         elif item_dict:
             self._item_list = list(item_dict.keys())
             self._item_dict = item_dict
-            self.value = list(self._item_dict.values())[0]
+            self.value = next(iter(self._item_dict.values()))
         else:
             raise ValueError("One of item_list or item_dict must be supplied.")
 
@@ -277,18 +277,20 @@ def _pre_process_tree(proc_tree: pd.DataFrame, schema: ProcSchema = None):
     proc_tree.loc[~long_cmd, "cmd"] = proc_tree[schema.cmd_line].fillna(
         "cmdline unknown"
     )
-    proc_tree["Exe"] = proc_tree.apply(
-        lambda x: x[schema.process_name].split(schema.path_separator)[-1], axis=1
+    proc_tree["Exe"] = (
+        proc_tree[schema.process_name].str.rsplit(schema.path_separator, n=1).str[-1]
     )
-    pid_fmt = (
-        lambda x: f"PID: {x} ({int(x, base=16)})"
-        if str(x).startswith("0x")
-        else f"PID: 0x{int(x):x} ({int(x)})"
-    )
-    proc_tree["PID"] = proc_tree[schema.process_id].apply(pid_fmt)
+    proc_tree["PID"] = proc_tree[schema.process_id].map(_pid_fmt)
     return TreeResult(proc_tree=proc_tree, schema=schema, levels=levels, n_rows=n_rows)
 
 
+def _pid_fmt(pid) -> str:
+    """Return PID label with hex and decimal values."""
+    if str(pid).startswith("0x"):
+        return f"PID: {pid} ({int(pid, base=16)})"
+    return f"PID: 0x{int(pid):x} ({int(pid)})"
+
+
 def _validate_plot_schema(proc_tree: pd.DataFrame, schema):
     """Validate that we have the required columns."""
     required_cols = set(
@@ -275,10 +275,12 @@ def display_timeline_values(
 
     # Create the Plot figure
     title = title if title else "Timeline"
-    min_time = graph_df[time_column].min()
-    max_time = graph_df[time_column].max()
-    start_range = min_time - ((max_time - min_time) * 0.1)
-    end_range = max_time + ((max_time - min_time) * 0.1)
+    time_values = graph_df[time_column]
+    min_time = time_values.min()
+    max_time = time_values.max()
+    time_pad = (max_time - min_time) * 0.1
+    start_range = min_time - time_pad
+    end_range = max_time + time_pad
     height = height if height else _calc_auto_plot_height(series_count)
 
     plot = figure(
@@ -310,12 +312,13 @@ def display_timeline_values(
     # plot groups individually so that we can create an interactive legend
     if group_by:
         legend_items = []
+        grouped_dfs = dict(iter(graph_df.groupby(group_by, sort=False)))
         for _, group_id in group_count_df[group_by].items():
-            first_group_item = graph_df[graph_df[group_by] == group_id].iloc[0]
-            legend_label = str(first_group_item[group_by])
+            group_df = grouped_dfs[group_id]
+            legend_label = str(group_df[group_by].iat[0])
             inline_legend = str(group_id)
-            group_color = first_group_item["color"]
-            row_source = ColumnDataSource(graph_df[graph_df[group_by] == group_id])
+            group_color = group_df["color"].iat[0]
+            row_source = ColumnDataSource(group_df)
             p_series = []
             # create default plot args
             plot_args: Dict[str, Any] = dict(
@@ -456,8 +459,9 @@ def _display_timeline_dict(data: dict, **kwargs) -> figure:  # noqa: C901, MC000
     )
 
     title = f"Timeline: {title}" if title else "Event Timeline"
-    start_range = min_time - ((max_time - min_time) * 0.1)
-    end_range = max_time + ((max_time - min_time) * 0.1)
+    time_pad = (max_time - min_time) * 0.1
+    start_range = min_time - time_pad
+    end_range = max_time + time_pad
     height = height if height else _calc_auto_plot_height(len(data))
     y_range = ((-1 / series_count), series_count - 1 + (1 / series_count))
     plot = figure(
@@ -510,34 +514,28 @@ def _display_timeline_dict(data: dict, **kwargs) -> figure:  # noqa: C901, MC000
     # if legend_pos is "inline", we add add the normal legend inside the plot
     # if legend_pos is "left" or "right", we add the legend to the side
     legend_items = []
+    inline_legend = legend_pos == "inline"
+    external_legend = legend_pos in ["left", "right"]
     for ser_name, series_def in data.items():
-        if legend_pos == "inline":
-            p_series = plot.diamond(
-                x=series_def["time_column"],
-                y="y_index",
-                color=series_def["color"],
-                alpha=0.5,
-                size=10,
-                source=series_def["source"],
-                legend_label=str(ser_name),
-            )
-        else:
-            p_series = plot.diamond(
-                x=series_def["time_column"],
-                y="y_index",
-                color=series_def["color"],
-                alpha=0.5,
-                size=10,
-                source=series_def["source"],
-            )
-        if legend_pos in ["left", "right"]:
+        plot_args: Dict[str, Any] = dict(
+            x=series_def["time_column"],
+            y="y_index",
+            color=series_def["color"],
+            alpha=0.5,
+            size=10,
+            source=series_def["source"],
+        )
+        if inline_legend:
+            plot_args["legend_label"] = str(ser_name)
+        p_series = plot.diamond(**plot_args)
+        if external_legend:
             legend_items.append((str(ser_name), [p_series]))
 
-    if legend_pos == "inline":
+    if inline_legend:
         # Position the inline legend
         plot.legend.location = "center_left"
         plot.legend.click_policy = "hide"
-    elif legend_pos in ["left", "right"]:
+    elif external_legend:
         # Create the legend box outside of the plot area
         ext_legend = Legend(
             items=legend_items,
@@ -597,8 +595,9 @@ def _unpack_data_series_dict(data, **kwargs):
             time_col = time_column
             series_def["time_column"] = time_col
 
-        min_time = min(min_time, series_data[time_col].min())
-        max_time = max(max_time, series_data[time_col].max())
+        time_values = series_data[time_col]
+        min_time = min(min_time, time_values.min())
+        max_time = max(max_time, time_values.max())
         data_columns.update([time_col])
         # Create the Column data source to plot
         graph_df = series_data[list(data_columns)].copy()
@@ -641,9 +640,9 @@ def _create_data_grouping(data, source_columns, time_column, group_by, color):
         # Shift the Viridis palatte so we lose the top, harder-to-see colors
         series_count = len(group_count_df)
         colors, palette_size = _get_color_palette(series_count)
-        group_count_df["color"] = group_count_df.apply(
-            lambda x: colors[x.y_index % palette_size], axis=1
-        )
+        group_count_df["color"] = [
+            colors[y_index % palette_size] for y_index in group_count_df["y_index"]
+        ]
         # re-join with the original data
         data_columns.update([group_by, "y_index", "color"])
         clean_data = data.drop(columns=["y_index", "color"], errors="ignore")
@@ -687,7 +686,8 @@ def _create_dict_from_grouping(data, source_columns, time_column, group_by, colo
             color_index += 1
 
     else:
-        group_df = data[list(data_columns)].copy()
+        # _unpack_data_series_dict takes its own copy before adding columns
+        group_df = data[list(data_columns)]
         series_dict["unnamed series"] = dict(
             data=group_df,
             time_column=time_column,
@@ -793,7 +793,15 @@ def _wrap_df_columns(data: pd.DataFrame, wrap_len: int = 50):
     if not data.empty:
         for col in data.columns:
             if isinstance(data[col].iloc[0], str):
-                data[col] = data[col].str.wrap(wrap_len)
+                # only wrap values that textwrap would change - those longer
+                # than wrap_len or with leading/trailing/control whitespace
+                wrap_vals = (data[col].str.len() > wrap_len) | data[col].str.contains(
+                    r"^\s|\s$|[\t\n\r\f\v]", na=False
+                )
+                if wrap_vals.any():
+                    data.loc[wrap_vals, col] = data.loc[wrap_vals, col].str.wrap(
+                        wrap_len
+                    )
 
 
 def _get_tick_formatter() -> DatetimeTickFormatter:
@@ -821,8 +829,9 @@ def _create_range_tool(
     data, min_time, max_time, plot_range, width, height, time_column: str = None
 ):
     """Create plot bar to act as as range selector."""
-    ext_min = min_time - ((max_time - min_time) * 0.15)
-    ext_max = max_time + ((max_time - min_time) * 0.15)
+    time_pad = (max_time - min_time) * 0.15
+    ext_min = min_time - time_pad
+    ext_max = max_time + time_pad
     plot_height = max(120, int(height * 0.20))
     rng_select = figure(
         x_range=(ext_min, ext_max),
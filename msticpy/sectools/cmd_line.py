@@ -79,12 +79,8 @@ def risky_cmd_line(
         )
 
     events[cmd_field].replace("", np.nan, inplace=True)
-    activity = (
-        events[["TimeGenerated", cmd_field]]
-        .dropna()
-        .set_index("TimeGenerated")
-        .to_dict()
-    )
+    cmd_events = events[["TimeGenerated", cmd_field]].dropna()
+    activity = dict(zip(cmd_events["TimeGenerated"], cmd_events[cmd_field]))
     with open(detection_rules) as json_file:
         rules = json.load(json_file)
 
@@ -96,7 +92,7 @@ def risky_cmd_line(
     risky_actions = {}
     detections = rules[log_type]
     for detection in detections:
-        for date, message in activity[cmd_field].items():
+        for date, message in activity.items():
             if b64_regex.match(message):
                 b64match = b64_regex.search(message)
                 b64string = unpack(input_string=b64match[1])  # type: ignore
@@ -626,11 +626,14 @@ def generate_items(
 
 @generate_items.register(pd.DataFrame)
 def _(data: pd.DataFrame, obs_col: str, ioc_type_col: Optional[str] = None):
-    for _, row in data.iterrows():
-        if ioc_type_col is None:
-            yield row[obs_col], TIProvider.resolve_ioc_type(row[obs_col])
-        else:
-            yield row[obs_col], row[ioc_type_col]
+    if ioc_type_col is None:
+        for observable in data[obs_col]:
+            yield observable, TIProvider.resolve_ioc_type(observable)
+    else:
+        for observable, ioc_type in data[[obs_col, ioc_type_col]].itertuples(
+            index=False, name=None
+        ):
+            yield observable, ioc_type
 
 
 @generate_items.register(dict)  # type: ignore
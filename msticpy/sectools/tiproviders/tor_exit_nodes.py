@@ -45,23 +45,33 @@ class Tor(TIProvider):
     @classmethod
     def _check_and_get_nodelist(cls):
         """Pull down Tor exit node list and save to internal attribute."""
-        if cls._cache_lock.locked():
+        if not cls._nodelist_expired():
             return
-        now = datetime.utcnow()
-        if not cls._nodelist or (now - cls._last_cached).days > 1:
+        with cls._cache_lock:
+            # another instance may have refreshed the list while we
+            # were waiting for the lock
+            if not cls._nodelist_expired():
+                return
             try:
-                resp = requests.get(cls._BASE_URL)
-                tor_raw_list = resp.content.decode()
-                with cls._cache_lock:
-                    cls._nodelist = dict(cls._tor_splitter(tor_raw_list))
-                    cls._last_cached = datetime.utcnow()
+                with requests.get(cls._BASE_URL, stream=True) as resp:
+                    resp.encoding = resp.encoding or "utf-8"
+                    tor_lines = resp.iter_lines(decode_unicode=True)
+                    cls._nodelist = dict(cls._tor_splitter(tor_lines))
+                cls._last_cached = datetime.utcnow()
             except ConnectionError:
                 pass
 
+    @classmethod
+    def _nodelist_expired(cls) -> bool:
+        """Return True if the node list is empty or more than a day old."""
+        return not cls._nodelist or (datetime.utcnow() - cls._last_cached).days > 1
+
     @staticmethod
-    def _tor_splitter(node_list) -> Iterable[Tuple[str, Dict[str, str]]]:
+    def _tor_splitter(
+        node_list: Iterable[str],
+    ) -> Iterable[Tuple[str, Dict[str, str]]]:
         node_dict: Dict[str, str] = {}
-        for line in node_list.split("\n"):
+        for line in node_list:
             if not line:
                 continue
             fields = line.split(" ", 2)
@@ -100,17 +110,20 @@ class Tor(TIProvider):
             ioc=ioc, ioc_type=ioc_type, query_subtype=query_type
         )
 
+        # take a single reference so that a concurrent refresh can't
+        # give us a mix of old and new node lists
+        nodelist = self._nodelist
         result.provider = kwargs.get("provider_name", self.__class__.__name__)
-        result.result = bool(self._nodelist)
+        result.result = bool(nodelist)
         result.reference = self._BASE_URL
 
-        if result.status and not bool(self._nodelist):
+        if result.status and not nodelist:
             result.status = TILookupStatus.query_failed.value
 
         if result.status:
             return result
 
-        tor_node = self._nodelist.get(ioc)
+        tor_node = nodelist.get(ioc)
 
         if tor_node:
             result.set_severity(TISeverity.warning)
@@ -9,9 +9,12 @@ from pathlib import Path
 
 import nbformat
 import notebook
+import pandas as pd
 import pytest
 from nbconvert.preprocessors import CellExecutionError, ExecutePreprocessor
 
+from ..msticpy.nbtools.timeline import _wrap_df_columns
+
 _NB_FOLDER = "docs/notebooks"
 _NB_NAME = "EventTimeline.ipynb"
 
@@ -39,3 +42,32 @@ class TestTimeline(unittest.TestCase):
             with open(nb_err, mode="w", encoding="utf-8") as f:
                 nbformat.write(nb, f)
             raise
+
+
+def test_wrap_df_columns():
+    data = pd.DataFrame(
+        {
+            "CommandLine": [
+                "short value",
+                "trailing space ",
+                " leading space",
+                "tab\tseparated",
+                "line\nbreak",
+                "aaaaaaaaaa bbbbbbbbbb cccccccccc",
+                None,
+            ],
+            "EventID": range(7),
+        }
+    )
+    _wrap_df_columns(data, 20)
+
+    assert data["CommandLine"].iloc[:6].tolist() == [
+        "short value",
+        "trailing space",
+        " leading space",
+        "tab     separated",
+        "line break",
+        "aaaaaaaaaa\nbbbbbbbbbb\ncccccccccc",
+    ]
+    assert pd.isna(data["CommandLine"].iloc[6])
+    assert data["EventID"].tolist() == list(range(7))
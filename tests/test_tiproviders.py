@@ -15,6 +15,8 @@ from pathlib import Path
 from typing import Any, Tuple, Union
 from unittest import mock
 
+import requests
+
 from ..msticpy.nbtools import pkg_config
 from ..msticpy.sectools.iocextract import IoCExtract
 from ..msticpy.sectools.tilookup import TILookup
@@ -25,6 +27,7 @@ from ..msticpy.sectools.tiproviders import (
     get_provider_settings,
     preprocess_observable,
 )
+from ..msticpy.sectools.tiproviders import tor_exit_nodes
 
 _test_data_folders = [
     d for d, _, _ in os.walk(os.getcwd()) if d.endswith("/tests/testdata")
@@ -448,3 +451,61 @@ class TestTIProviders(unittest.TestCase):
         self.assertEqual(lu_result.status, 2)
         lu_result = provider._check_ioc_type(ioc="123456", ioc_type="file_hash")
         self.assertEqual(lu_result.status, 2)
+
+
+# Mixes CRLF and LF line endings and includes a node with two exit addresses
+_TOR_EXIT_LIST = (
+    b"ExitNode 0011BD2485AD45D984EC4159C88FC066E5E3300E\r\n"
+    b"Published 2020-05-04 03:49:27\r\n"
+    b"LastStatus 2020-05-04 09:00:00\r\n"
+    b"ExitAddress 162.247.74.201 2020-05-04 09:06:29\r\n"
+    b"ExitNode 0091174DE56EADE06D0A3C1C51E6A7C1B4D2D55B\n"
+    b"Published 2020-05-04 01:44:07\n"
+    b"LastStatus 2020-05-04 02:00:00\n"
+    b"ExitAddress 185.220.101.28 2020-05-04 02:05:12\n"
+    b"ExitAddress 185.220.101.29 2020-05-04 02:06:12\n"
+)
+
+
+def _tor_exit_list_response(*args, **kwargs):
+    del args, kwargs
+    resp = requests.Response()
+    resp.status_code = 200
+    resp.raw = io.BytesIO(_TOR_EXIT_LIST)
+    return resp
+
+
+@mock.patch.object(tor_exit_nodes.Tor, "_last_cached", tor_exit_nodes.datetime.min)
+@mock.patch.object(tor_exit_nodes.Tor, "_nodelist", {})
+@mock.patch.object(tor_exit_nodes.requests, "get", side_effect=_tor_exit_list_response)
+def test_tor_exit_nodes_offline(mock_get):
+    tor_prov = tor_exit_nodes.Tor()
+
+    mock_get.assert_called_once()
+    assert mock_get.call_args[1]["stream"]
+    assert set(tor_prov._nodelist) == {
+        "162.247.74.201",
+        "185.220.101.28",
+        "185.220.101.29",
+    }
+    crlf_node = tor_prov._nodelist["162.247.74.201"]
+    assert crlf_node["ExitNode"] == "0011BD2485AD45D984EC4159C88FC066E5E3300E"
+    assert crlf_node["LastStatus"] == "2020-05-04"
+
+    for ioc in ("185.220.101.28", "185.220.101.29"):
+        result = tor_prov.lookup_ioc(ioc=ioc, ioc_type="ipv4")
+        assert result.result
+        assert result.severity > 0
+        assert result.details == {
+            "NodeID": "0091174DE56EADE06D0A3C1C51E6A7C1B4D2D55B",
+            "LastStatus": "2020-05-04",
+        }
+
+    result = tor_prov.lookup_ioc(ioc="13.107.4.50", ioc_type="ipv4")
+    assert result.result
+    assert result.severity == 0
+    assert result.details == "Not found."
+
+    # a second instance uses the cached list
+    tor_exit_nodes.Tor()
+    mock_get.assert_called_once()